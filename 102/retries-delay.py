@@ -1,8 +1,17 @@
 import httpx
 from prefect import flow, task
+from prefect.tasks import exponential_backoff
 
 
-@task(retries=4, retry_delay_seconds=0.5)  # or [0.1, 0.5, 1, 2])
+# exponential backoff with jitter so many failing tasks don't retry in lockstep;
+# the "httpstat" tag can share a concurrency limit across runs:
+#   prefect concurrency-limit create httpstat 10
+@task(
+    retries=4,
+    retry_delay_seconds=exponential_backoff(backoff_factor=0.5),  # or 0.5, or [0.1, 0.5, 1, 2]
+    retry_jitter_factor=1,
+    tags=["httpstat"],
+)
 def fetch_random_code():
     random_code = httpx.get("https://httpstat.us/Random/200,500", verify=False)
     if random_code.status_code >= 400:
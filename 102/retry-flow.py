@@ -1,14 +1,23 @@
 import httpx
-from prefect import flow
+from prefect import flow, task
 
 
-@flow(retries=4)
+@task(persist_result=True)
 def fetch_random_code():
     random_code = httpx.get("https://httpstat.us/Random/200,500", verify=False)
     if random_code.status_code >= 400:
         raise Exception()
-    print(random_code.text)
+    return random_code.text
+
+
+# on a flow retry, task runs that already completed with a persisted result
+# are not re-executed; only the failed task and anything after it run again
+@flow(retries=4, log_prints=True)
+def fetch_random_codes():
+    first = fetch_random_code()
+    second = fetch_random_code()
+    print(first, second)
 
 
 if __name__ == "__main__":
-    fetch_random_code()
+    fetch_random_codes()
@@ -0,0 +1,76 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from prefect import flow, task
+
+# at most MAX_CONCURRENT_CHUNKS * THREADS_PER_CHUNK requests are in flight at once
+MAX_CONCURRENT_CHUNKS = 4
+THREADS_PER_CHUNK = 8
+
+
+def fetch_weather(lat: float, lon: float):
+    base_url = "https://api.open-meteo.com/v1/forecast/"
+    temps = httpx.get(
+        base_url,
+        params=dict(latitude=lat, longitude=lon, hourly="temperature_2m"),
+    )
+    return float(temps.json()["hourly"]["temperature_2m"][0])
+
+
+@task
+def fetch_weather_chunk(points: list[tuple[float, float]]):
+    "Fetch a chunk of points in one task run, keeping per-point results and errors."
+
+    def fetch(point):
+        try:
+            return dict(point=point, temp=fetch_weather(*point))
+        except Exception as exc:
+            return dict(point=point, error=repr(exc))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS_PER_CHUNK) as pool:
+        results = list(pool.map(fetch, points))
+    return dict(results=results, seconds=time.perf_counter() - start)
+
+
+def chunked(items: list, size: int) -> list[list]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+@flow(log_prints=True)
+def weather_grid(step: float = 10.0, target_chunk_seconds: float = 5.0):
+    if step <= 0:
+        raise ValueError("step must be greater than 0")
+    points = [
+        (lat * step, lon * step)
+        for lat in range(int(-90 / step), int(90 / step))
+        for lon in range(int(-180 / step), int(180 / step))
+    ]
+    if not points:
+        print(f"No grid points for step {step}")
+        return []
+
+    # size chunks from a small probe so each task run does a few seconds of work;
+    # the probe runs alone, so per-point latency can rise once several chunks
+    # share the API and chunks may then take longer than the target
+    probe, rest = points[:64], points[64:]
+    first = fetch_weather_chunk(probe)
+    per_point = first["seconds"] / len(probe)
+    chunk_size = int(target_chunk_seconds / per_point) if per_point else len(rest)
+    chunk_size = max(1, chunk_size)
+
+    # the default task runner has no worker cap, so map the chunks in waves
+    results = first["results"]
+    chunks = chunked(rest, chunk_size)
+    for wave in chunked(chunks, MAX_CONCURRENT_CHUNKS):
+        for future in fetch_weather_chunk.map(wave):
+            results += future.result()["results"]
+
+    failed = [r for r in results if "error" in r]
+    print(f"{len(results)} points in chunks of {chunk_size}, {len(failed)} failed")
+    return results
+
+
+if __name__ == "__main__":
+    weather_grid()
@@ -0,0 +1,98 @@
+import functools
+import json
+import resource
+import sys
+import time
+from collections import defaultdict
+
+import httpx
+from prefect import flow, runtime, task
+from prefect.artifacts import create_markdown_artifact
+
+# keyed by flow run id so repeated runs in one process don't mix their rows
+timings = defaultdict(list)
+
+
+def process_peak_rss_kb() -> int:
+    "High-water mark of the whole process; ru_maxrss is bytes on macOS, KB on Linux."
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def profiled(fn):
+    """Record wall time, CPU time and how much each call of the wrapped function
+    raised the process's peak RSS."""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        wall, cpu = time.perf_counter(), time.process_time()
+        peak = process_peak_rss_kb()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            timings[runtime.flow_run.id].append(
+                dict(
+                    name=fn.__name__,
+                    wall_s=round(time.perf_counter() - wall, 4),
+                    cpu_s=round(time.process_time() - cpu, 4),
+                    peak_rss_growth_kb=process_peak_rss_kb() - peak,
+                    process_peak_rss_kb=process_peak_rss_kb(),
+                )
+            )
+
+    return wrapper
+
+
+@task
+@profiled
+def fetch_weather(lat: float, lon: float):
+    base_url = "https://api.open-meteo.com/v1/forecast/"
+    temps = httpx.get(
+        base_url,
+        params=dict(latitude=lat, longitude=lon, hourly="temperature_2m"),
+    )
+    forecasted_temp = float(temps.json()["hourly"]["temperature_2m"][0])
+    print(f"Forecasted temp C: {forecasted_temp} degrees")
+    return forecasted_temp
+
+
+@task
+@profiled
+def save_weather(temp: float):
+    with open("weather.csv", "w+") as w:
+        w.write(str(temp))
+    return "Successfully wrote temp"
+
+
+@task
+def report_timings():
+    run_timings = timings.pop(runtime.flow_run.id, [])
+    rows = "\n".join(
+        f"| {t['name']} | {t['wall_s']} | {t['cpu_s']} "
+        f"| {t['peak_rss_growth_kb']} | {t['process_peak_rss_kb']} |"
+        for t in run_timings
+    )
+    create_markdown_artifact(
+        key="weather-timings",
+        markdown=f"""# Task Timings
+
+| Task | Wall (s) | CPU (s) | Peak RSS growth (KB) | Process peak RSS (KB) |
+|:-----|-------:|-------:|-------:|-------:|
+{rows}
+""",
+        description="Per-task timings for the weather pipeline",
+    )
+    with open("weather-timings.json", "w") as f:
+        json.dump(run_timings, f, indent=2)
+
+
+@flow
+def pipeline(lat: float = 38.9, lon: float = -77.0):
+    temp = fetch_weather(lat, lon)
+    result = save_weather(temp)
+    report_timings()
+    return result
+
+
+if __name__ == "__main__":
+    pipeline()
@@ -1,4 +1,9 @@
+import hashlib
+import subprocess
+from pathlib import Path
+
 from prefect import flow
+from prefect.deployments import DeploymentImage
 
 
 @flow(log_prints=True)
@@ -6,10 +11,41 @@ def buy():
     print("Buying securities")
 
 
+def source_tag() -> str:
+    "Short hash of the flow source, requirements and Dockerfile, used as the image tag."
+    here = Path(__file__).parent
+    digest = hashlib.sha256()
+    for path in (
+        Path(__file__),
+        here / "requirements.txt",
+        here.parent / "Dockerfile-example",
+    ):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def image_exists(image: str) -> bool:
+    "True if the image is already in the local Docker cache."
+    try:
+        result = subprocess.run(
+            ["docker", "image", "inspect", image], capture_output=True
+        )
+    except FileNotFoundError:  # no docker CLI on PATH, so let Prefect build
+        return False
+    return result.returncode == 0
+
+
 if __name__ == "__main__":
+    # run from the repo root so the build context matches Dockerfile-example
+    tag = source_tag()
     buy.deploy(
         name="my-code-in-an-image-deployment",
         work_pool_name="my-docker-pool",
-        image="discdiver/local-image:1.0",
+        image=DeploymentImage(
+            name="discdiver/local-image",
+            tag=tag,
+            dockerfile="Dockerfile-example",
+        ),
+        build=not image_exists(f"discdiver/local-image:{tag}"),
         push=False,
     )
@@ -3,7 +3,7 @@ from prefect import flow, pause_flow_run
 
 @flow(log_prints=True)
 def greet_user():
-    user = pause_flow_run(wait_for_input=str)
+    user = pause_flow_run(wait_for_input=str, poll_interval=1)
     print(f"Hello, {user}!")
 
 
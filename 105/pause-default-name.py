@@ -7,10 +7,15 @@ class UserNameInput(RunInput):
     name: str
 
 
+# with_initial_data builds a new class on each call, so build it once per process
+AnonymousUserNameInput = UserNameInput.with_initial_data(name="anonymous")
+
+
 @flow(log_prints=True)
 async def greet_user():
     user_input = await pause_flow_run(
-        wait_for_input=UserNameInput.with_initial_data(name="anonymous")
+        wait_for_input=AnonymousUserNameInput,
+        poll_interval=1,
     )
 
     if user_input.name == "anonymous":
@@ -18,7 +18,7 @@ class ShirtOrder(RunInput):
 
 @flow
 def get_shirt_order():
-    shirt_order = pause_flow_run(wait_for_input=ShirtOrder)
+    shirt_order = pause_flow_run(wait_for_input=ShirtOrder, poll_interval=1)
 
 
 if __name__ == "__main__":
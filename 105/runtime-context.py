@@ -5,12 +5,14 @@ from prefect import runtime
 @flow(log_prints=True)
 def my_flow(x):
     print("My name is", runtime.flow_run.name)
+    # the deployment is read from the API on first access, then cached per process
     print("I belong to deployment", runtime.deployment.name)
     my_task(2)
 
 
 @task
 def my_task(y):
+    # flow_run and task_run attributes come from the in-process run context
     print("My name is", runtime.task_run.name)
     print("Flow run parameters:", runtime.flow_run.parameters)
 
@@ -7,11 +7,17 @@ def downstream_flow(ticker: str = "AAPL") -> str:
     print(f"got {ticker}")
 
 
+upstream_flow_ids = [
+    "5c933ae4-dd43-4705-90eb-cfdeb4c028fb",
+]
+
+# one trigger matching a list of resource ids is evaluated once per event,
+# rather than once per upstream flow with a trigger each
 downstream_deployment_trigger = DeploymentTrigger(
     name="Upstream Flow - Pipeline",
     enabled=True,
     match_related={
-        "prefect.resource.id": "prefect.flow.5c933ae4-dd43-4705-90eb-cfdeb4c028fb"
+        "prefect.resource.id": [f"prefect.flow.{id}" for id in upstream_flow_ids]
     },
     expect={"prefect.flow-run.Completed"},
 )
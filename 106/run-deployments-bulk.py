@@ -0,0 +1,96 @@
+import asyncio
+import time
+from typing import Optional
+
+from jsonschema.validators import validator_for
+from prefect import get_client
+from prefect.client.schemas.filters import FlowRunFilter, FlowRunFilterId
+
+
+class RunDeploymentsError(Exception):
+    "Some flow runs failed to create; `flow_runs` holds the ones that were created."
+
+    def __init__(self, flow_runs, errors):
+        super().__init__(f"{len(errors)} of {len(flow_runs) + len(errors)} runs failed")
+        self.flow_runs = flow_runs
+        self.errors = errors
+
+
+async def run_deployments(
+    name: str,
+    parameter_list: list[dict],
+    limit: int = 50,
+    wait: bool = False,
+    timeout: Optional[float] = None,
+):
+    "Trigger one flow run per parameter set, sharing a single client connection."
+    async with get_client() as client:
+        deployment = await client.read_deployment_by_name(name)
+
+        # build the validator once and check every parameter set up front
+        schema = deployment.parameter_openapi_schema or {}
+        validator = validator_for(schema)(schema)
+        for parameters in parameter_list:
+            validator.validate(parameters)
+
+        semaphore = asyncio.Semaphore(limit)
+
+        async def create(parameters):
+            async with semaphore:
+                return await client.create_flow_run_from_deployment(
+                    deployment.id, parameters=parameters
+                )
+
+        created = await asyncio.gather(
+            *[create(p) for p in parameter_list], return_exceptions=True
+        )
+        flow_runs = [run for run in created if not isinstance(run, BaseException)]
+        errors = [run for run in created if isinstance(run, BaseException)]
+        if errors:
+            raise RunDeploymentsError(flow_runs, errors)
+
+        if wait:
+            flow_runs = await wait_for_flow_runs(client, flow_runs, timeout=timeout)
+    return flow_runs
+
+
+async def wait_for_flow_runs(
+    client, flow_runs, poll_interval: float = 5, timeout: Optional[float] = None
+):
+    """Watch all runs with one read per poll instead of one per run.
+
+    Runs still unfinished when the timeout expires are returned as last seen.
+    """
+    pending = {flow_run.id: flow_run for flow_run in flow_runs}
+    finished = {}
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while pending:
+        if deadline is None:
+            await asyncio.sleep(poll_interval)
+        elif (remaining := deadline - time.monotonic()) > 0:
+            await asyncio.sleep(min(poll_interval, remaining))
+        else:
+            break
+        waiting = list(pending)
+        for offset in range(0, len(waiting), 200):
+            ids = waiting[offset : offset + 200]
+            for flow_run in await client.read_flow_runs(
+                flow_run_filter=FlowRunFilter(id=FlowRunFilterId(any_=ids))
+            ):
+                if flow_run.state and flow_run.state.is_final():
+                    del pending[flow_run.id]
+                    finished[flow_run.id] = flow_run
+                else:
+                    pending[flow_run.id] = flow_run
+    finished.update(pending)
+    return [finished[flow_run.id] for flow_run in flow_runs]
+
+
+if __name__ == "__main__":
+    grid = [{"lat": lat, "lon": lon} for lat in range(10) for lon in range(10)]
+
+    start = time.perf_counter()
+    flow_runs = asyncio.run(
+        run_deployments("pipeline/my-first-managed-deployment", grid)
+    )
+    print(f"Created {len(flow_runs)} runs in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,149 @@
+"""Time representative course flows against an ephemeral Prefect server.
+
+    python benchmarks/run.py                      # write results.json
+    python benchmarks/run.py --baseline old.json  # also compare against a baseline
+
+External HTTP calls are answered by a local stub so only orchestration
+overhead is measured. A flow with no tasks is timed as a reference:
+`per_task_overhead_s` is a case's median minus that reference, divided by its
+number of task and subflow runs. It still includes the (stubbed) task bodies,
+which are negligible next to the orchestration calls.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from unittest import mock
+
+import httpx
+from prefect import flow
+from prefect.testing.utilities import prefect_test_harness
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STUB_RESPONSES = {
+    "api.open-meteo.com": {"hourly": {"temperature_2m": [21.5]}},
+    "catfact.ninja": {"fact": "Cats sleep a lot."},
+    "dogapi.dog": {"data": [{"attributes": {"body": "Dogs like walks."}}]},
+}
+
+# (name, file, flow attribute, kwargs, number of task and subflow runs per run)
+CASES = [
+    ("weather2-tasks", "102/weather2-tasks.py", "pipeline", {}, 2),
+    ("caching", "102/caching1.py", "hello_flow", {"name_input": "Liz"}, 1),
+    ("subflows", "106/subflow.py", "animal_facts", {}, 2),
+]
+
+
+def stub_get(url, *args, **kwargs):
+    host = httpx.URL(url).host
+    return httpx.Response(
+        200, json=STUB_RESPONSES[host], request=httpx.Request("GET", url)
+    )
+
+
+def load_flow(path: str, attr: str):
+    spec = importlib.util.spec_from_file_location(Path(path).stem, ROOT / path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, attr)
+
+
+@flow
+def empty_flow():
+    "Reference flow with no tasks; its duration is the per-flow overhead."
+
+
+def run_case(flow_to_time, kwargs: dict, runs: int) -> dict:
+    flow_to_time(**kwargs)  # warm up imports and the server
+
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        flow_to_time(**kwargs)
+        durations.append(time.perf_counter() - start)
+
+    # memory gets its own pass so tracemalloc overhead stays out of the timings
+    tracemalloc.start()
+    flow_to_time(**kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return dict(
+        median_s=statistics.median(durations),
+        max_s=max(durations),
+        flows_per_s=runs / sum(durations),
+        peak_mem_kb=peak // 1024,
+    )
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["median_s"], result["median_s"]
+        if after > before * (1 + tolerance):
+            regressions.append(f"{name}: {before:.4f}s -> {after:.4f}s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--output", default="results.json")
+    parser.add_argument("--baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+    output = Path(args.output).resolve()
+
+    # read the baseline up front so writing the new results can't replace it
+    baseline = None
+    if args.baseline:
+        if Path(args.baseline).resolve() == output:
+            parser.error("--baseline and --output must be different files")
+        baseline = json.loads(Path(args.baseline).read_text())
+
+    results = {}
+    cwd = os.getcwd()
+    with prefect_test_harness(), mock.patch("httpx.get", stub_get):
+        with tempfile.TemporaryDirectory() as workdir:
+            os.chdir(workdir)  # weather2-tasks writes weather.csv to the cwd
+            try:
+                reference = run_case(empty_flow, {}, args.runs)
+                results["empty-flow"] = reference
+                print(
+                    f"{'empty-flow':16} median {reference['median_s'] * 1000:8.1f} ms"
+                )
+                for name, path, attr, kwargs, tasks in CASES:
+                    result = run_case(load_flow(path, attr), kwargs, args.runs)
+                    result["per_task_overhead_s"] = (
+                        result["median_s"] - reference["median_s"]
+                    ) / tasks
+                    results[name] = result
+                    print(
+                        f"{name:16} median {result['median_s'] * 1000:8.1f} ms"
+                        f"  per task {result['per_task_overhead_s'] * 1000:8.1f} ms"
+                        f"  peak {result['peak_mem_kb']:8} KB"
+                    )
+            finally:
+                os.chdir(cwd)
+
+    output.write_text(json.dumps(results, indent=2))
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
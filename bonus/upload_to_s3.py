@@ -1,15 +1,39 @@
+from functools import lru_cache
 from pathlib import Path
-from prefect import flow
+from prefect import flow, task, unmapped
 from prefect_aws.s3 import S3Bucket
 
 
+@lru_cache
+def load_s3_bucket(name: str = "s3-bucket-block") -> S3Bucket:
+    """Load the block once per flow run process, so the task runs below share it
+    instead of each making its own API call."""
+    return S3Bucket.load(name)
+
+
+def taxi_data_path(color: str, year: int, month: int) -> Path:
+    return Path(f"data/{color}/{year}/{color}_tripdata_{year}-{month:02}.parquet")
+
+
 @flow()
 def upload_to_s3(color: str, year: int, month: int) -> None:
     """The main flow function to upload taxi data"""
-    path = Path(f"data/{color}/{year}/{color}_tripdata_{year}-{month:02}.parquet")
+    path = taxi_data_path(color, year, month)
     s3_block = S3Bucket.load("s3-bucket-block")
     s3_block.upload_from_path(from_path=path, to_path=path)
 
 
+@task
+def upload_month(color: str, year: int, month: int) -> None:
+    path = taxi_data_path(color, year, month)
+    load_s3_bucket().upload_from_path(from_path=path, to_path=path)
+
+
+@flow()
+def upload_months_to_s3(color: str, year: int, months: list[int]) -> None:
+    """Upload several months of taxi data, one task run per month"""
+    upload_month.map(unmapped(color), unmapped(year), months)
+
+
 if __name__ == "__main__":
     upload_to_s3(color="green", year=2020, month=1)